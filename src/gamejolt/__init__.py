@@ -10,9 +10,16 @@ the signature for the request and append it to the URL.
 """
 
 from .endpoints import Formatter, Endpoints
-from .requester import RequesterAbstract
-
-__all__ = ["GameJolt", "Formatter", "Endpoints", "RequesterAbstract"]
+from .requester import RequesterAbstract, SessionRequester, ReplayRequester
+
+__all__ = [
+    "GameJolt",
+    "Formatter",
+    "Endpoints",
+    "RequesterAbstract",
+    "SessionRequester",
+    "ReplayRequester",
+]
 
 
 from .subcomponents import (
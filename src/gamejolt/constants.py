@@ -9,3 +9,8 @@ BASE_URL = "https://api.gamejolt.com/api/game/"
 API_VERSION = "v1_2"
 
 VERSIONS = {"v1": 1, "v1_1": 2, "v1_2": 3}
+
+# the version numbers, resolved once for the version guards
+V1 = VERSIONS["v1"]
+V1_1 = VERSIONS["v1_1"]
+V1_2 = VERSIONS["v1_2"]
@@ -1,40 +1,116 @@
-from urllib.parse import urlencode
+import sys
+from collections import namedtuple
+from functools import lru_cache, partial
+from types import MappingProxyType
+from typing import NamedTuple
+from urllib.parse import quote_plus
 from .utils import AttrDict
 from .constants import API_VERSION, BASE_URL
 
-supported_formats = ["json", "keypair", "dump", "xml"]  # gamejolt supported formats
+# gamejolt supported formats
+supported_formats_order = ("json", "keypair", "dump", "xml")
+supported_formats = frozenset(supported_formats_order)
 
-Endpoints = AttrDict(
-    USERS=AttrDict(FETCH="/users", AUTH="/users/auth"),
-    SESSIONS=AttrDict(
+_ENDPOINTS = dict(
+    USERS=dict(FETCH="/users", AUTH="/users/auth"),
+    SESSIONS=dict(
         OPEN="/sessions/open",
         PING="/sessions/ping",
         CHECK="/sessions/check",
         CLOSE="/sessions/close",
     ),
-    SCORES=AttrDict(
+    SCORES=dict(
         FETCH="/scores/",
         ADD="/scores/add",
         GET_RANK="/scores/get-rank",
         TABLES="/scores/tables",
     ),
-    TROPHIES=AttrDict(
+    TROPHIES=dict(
         FETCH="/trophies",
         ADD_ACHIEVED="/trophies/add-achieved",
         REMOVE_ACHIEVED="/trophies/remove-achieved",
     ),
-    DATASTORE=AttrDict(
+    DATASTORE=dict(
         FETCH="/data-store/fetch",
         GET_KEYS="/data-store/get-keys",
         REMOVE="/data-store/remove",
         SET="/data-store/set",
         UPDATE="/data-store/update",
     ),
-    FRIENDS=AttrDict(FETCH="/friends"),
-    TIME=AttrDict(FETCH="/time"),
+    FRIENDS=dict(FETCH="/friends"),
+    TIME=dict(FETCH="/time"),
 )
 
 
+def _freeze(name: str, tree):
+    """
+    Turns a nested dict into an immutable tree of namedtuples.
+
+    Attribute access on a namedtuple is a C-level slot lookup.
+
+    :param name: The name of the generated namedtuple type.
+    :type name: str
+    :param tree: The nested dict to freeze, leaves are returned as-is.
+    :return: The frozen tree.
+    """
+    if not isinstance(tree, dict):
+        return tree
+    node = namedtuple(name, tree)
+    return node(**{key: _freeze(key, value) for key, value in tree.items()})
+
+
+# the formatters walk this tree, Endpoints stays the public mapping
+_ENDPOINT_TREE = _freeze("Endpoints", _ENDPOINTS)
+Endpoints = AttrDict({group: AttrDict(paths) for group, paths in _ENDPOINTS.items()})
+
+# full URLs of every endpoint for the default base URL and API version, built once at import
+_FULL_URLS = MappingProxyType(
+    {
+        path: sys.intern(BASE_URL + API_VERSION + path)
+        for endpoints in _ENDPOINT_TREE
+        for path in endpoints
+    }
+)
+
+
+@lru_cache(maxsize=256)
+def _quote_key(key: str, encoding: str = "utf-8") -> str:
+    """
+    Percent-encodes a query key.
+
+    Memoized, since the API only uses a handful of query keys. Values are not: they
+    include user tokens and data store payloads, which should not outlive the request.
+
+    :param key: The key to encode.
+    :type key: str
+    :param encoding: The encoding to use for non-ASCII characters. Defaults to "utf-8".
+    :type encoding: str
+    :return: The encoded key.
+    :rtype: str
+    """
+    return quote_plus(key, encoding=encoding)
+
+
+def _fast_urlencode(items, encoding: str = "utf-8") -> str:
+    """
+    Encodes flat key/value pairs into a query string.
+
+    Equivalent to `urlencode` for the str -> str queries the Game Jolt API uses,
+    without its sequence and bytes handling.
+
+    :param items: The key/value pairs to encode.
+    :type items: Iterable[tuple[str, Any]]
+    :param encoding: The encoding to use for the query parameters. Defaults to "utf-8".
+    :type encoding: str
+    :return: The encoded query string.
+    :rtype: str
+    """
+    return "&".join(
+        f"{_quote_key(str(k), encoding)}={quote_plus(str(v), encoding=encoding)}"
+        for k, v in items
+    )
+
+
 def format_queries(url: str = "", /, encoding: str = "utf-8", **queries):
     """
     Formats the given URL with query parameters.
@@ -45,7 +121,7 @@ def format_queries(url: str = "", /, encoding: str = "utf-8", **queries):
     :return: The formatted URL with query parameters.
     :rtype: str
     """
-    return ((url and url + "?") or "") + urlencode(queries, encoding=encoding)
+    return ((url and url + "?") or "") + _fast_urlencode(queries.items(), encoding)
 
 
 class FormatterAbstract(object):
@@ -59,6 +135,8 @@ class FormatterAbstract(object):
         base_url (str): The base URL of the Game Jolt API.
         api_version (str): The version of the Game Jolt API.
         queries (dict[str, str]): A dictionary of additional query parameters to be included in the request.
+            They are encoded once at construction, so they should not be mutated afterwards.
+        format_cache_size (int): The maximum number of formatted URLs memoized by `format`.
 
     Methods
     -------
@@ -68,10 +146,19 @@ class FormatterAbstract(object):
             Formats the complete URL by appending the API version and endpoint to the base URL.
     """
 
+    format_cache_size = 256
+
     def __init__(self, *, base=BASE_URL, version=API_VERSION, **kwargs):
         self.base_url = base
         self.api_version = version
         self.queries = kwargs
+        self._url_prefix = f"{base}{version}"
+        self._url_cache: dict[str, str] = (
+            dict(_FULL_URLS) if self._url_prefix == BASE_URL + API_VERSION else {}
+        )
+        self._format_cache: dict[tuple, str] = {}
+        self._templates: dict[str, str] = {}
+        self._queries_encoded = _fast_urlencode(kwargs.items())
 
     def format_url(self, endpoint: str = "") -> str:
         """
@@ -85,8 +172,10 @@ class FormatterAbstract(object):
         This method constructs a URL by combining the base URL, API version, and a specified endpoint.
         When an endpoint is provided, it is appended to the base URL and version, forming a complete URL.
         """
-
-        return f"{self.base_url}{self.api_version}{endpoint}"
+        url = self._url_cache.get(endpoint)
+        if url is None:
+            url = self._url_cache[endpoint] = sys.intern(self._url_prefix + endpoint)
+        return url
 
     def format_queries(
         self, /, url: str = "", encoding: str = "utf-8", **queries: dict[str, str]
@@ -106,7 +195,15 @@ class FormatterAbstract(object):
         query string is appended to the URL, separating the base URL and the query parameters
         with a '?' and joining multiple parameters with '&'.
         """
-        return format_queries(url, encoding, **(self.queries | queries))
+        if encoding != "utf-8" or not self.queries.keys().isdisjoint(queries):
+            return format_queries(url, encoding, **(self.queries | queries))
+        if not queries:
+            query = self._queries_encoded
+        elif not self.queries:
+            query = _fast_urlencode(queries.items())
+        else:
+            query = self._queries_encoded + "&" + _fast_urlencode(queries.items())
+        return ((url and url + "?") or "") + query
 
     def format(self, endpoint: str = "", **queries: dict[str, str]) -> str:
         """
@@ -118,8 +215,69 @@ class FormatterAbstract(object):
         :type queries: dict
         :return: The fully formatted URL string.
         :rtype: str
+
+        Results are memoized per (endpoint, queries) as long as every query value is hashable,
+        up to `format_cache_size` entries. URLs carrying a user token or data store data
+        are never memoized, so neither outlives the request.
+        """
+        if "user_token" in queries or "data" in queries:
+            return self._render(endpoint, queries)
+        try:
+            # the type is part of the key: True, 1 and 1.0 are equal but encode differently
+            key = (endpoint, tuple(sorted((k, type(v), v) for k, v in queries.items())))
+            url = self._format_cache.get(key)
+        except TypeError:  # unhashable or unorderable query values, skip the cache
+            return self._render(endpoint, queries)
+        if url is None:
+            url = self._render(endpoint, queries)
+            if len(self._format_cache) >= self.format_cache_size:
+                # pop with a default, another thread may have evicted it already
+                self._format_cache.pop(next(iter(self._format_cache), None), None)
+            self._format_cache[key] = url
+        return url
+
+    def format_prefix(self, endpoint: str, query: str) -> str:
+        """
+        Formats the URL of an endpoint up to the value of one query.
+
+        Appending an encoded value to the prefix gives the same URL as
+        `FormatterAbstract.format(endpoint, **{query: value})`, so callers formatting the
+        same endpoint over and over only have to encode the value.
+
+        :param endpoint: The specific endpoint path to append to the base URL.
+        :type endpoint: str
+        :param query: The name of the query whose value is left out.
+        :type query: str
+        :return: The URL, ending with the encoded query name and "=".
+        :rtype: str
+        """
+        url = self._render(endpoint, {})
+        return f"{url}{'' if url.endswith('?') else '&'}{_quote_key(query)}="
+
+    def _render(self, endpoint: str, queries: dict) -> str:
+        """
+        Builds the URL for `format` from a per-endpoint template.
+
+        The template holds the static part of the URL (base URL, API version, endpoint
+        and the encoded instance queries) so only the call's queries are encoded.
+
+        :param endpoint: The specific endpoint path to append to the base URL.
+        :type endpoint: str
+        :param queries: Additional query parameters to append to the URL.
+        :type queries: dict
+        :return: The fully formatted URL string.
+        :rtype: str
         """
-        return self.format_queries(self.format_url(endpoint), **queries)
+        if not self.queries or not self.queries.keys().isdisjoint(queries):
+            return self.format_queries(self.format_url(endpoint), **queries)
+        template = self._templates.get(endpoint)
+        if template is None:
+            template = self._templates[endpoint] = (
+                self.format_url(endpoint) + "?" + self._queries_encoded
+            )
+        if not queries:
+            return template
+        return template + "&" + _fast_urlencode(queries.items())
 
 
 class Formatter(FormatterAbstract):
@@ -130,6 +288,21 @@ class Formatter(FormatterAbstract):
     It is the primary class for formatting URLs and is instantiated with the base URL and API version.
     """
 
+    _wrappers: dict[str, "EndpointWrapper"] = {}
+    # the next __getattr__ in the MRO, resolved once per class instead of probed on every miss
+    _super_getattr = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._super_getattr = getattr(super(Formatter, cls), "__getattr__", None)
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._wrappers = {
+            key: EndpointWrapper(self, endpoints)
+            for key, endpoints in _ENDPOINT_TREE._asdict().items()
+        }
+
     def __getattr__(self, key):
         """
         Returns an attribute of the current instance, or an EndpointWrapper if key exists in the constant Endpoints.
@@ -139,10 +312,11 @@ class Formatter(FormatterAbstract):
         :return: The value of the attribute if it exists.
         :raises AttributeError: If the attribute does not exist.
         """
-        if key in Endpoints:
-            return EndpointWrapper(self, Endpoints[key])
-        if hasattr(super(), "__getattr__"):
-            return super().__getattr__(key)
+        wrapper = self._wrappers.get(key)
+        if wrapper is not None:
+            return wrapper
+        if self._super_getattr is not None:
+            return self._super_getattr(key)
         raise AttributeError(
             f"type object '{type(self).__name__}' has no attribute '{key}'"
         )
@@ -152,10 +326,12 @@ class EndpointWrapper(AttrDict):
     """
     Wraps an Endpoint dictionary, providing a convenient way to access and format the URLs.
 
+    Every endpoint is bound to the formatter once, so accessing one is a single dict lookup.
+
     :param formatter: The Formatter instance to use for formatting URLs.
     :type formatter: Formatter
-    :param endpoints: The dictionary of endpoints to wrap.
-    :type endpoints: AttrDict[str, str]
+    :param endpoints: The group of endpoints to wrap, one of the groups in the endpoint tree.
+    :type endpoints: NamedTuple
     """
 
     __slots__ = (
@@ -163,23 +339,16 @@ class EndpointWrapper(AttrDict):
         "endpoints",
     )
 
-    def __init__(self, formatter: Formatter, endpoints: AttrDict[str, str]):
-        self.endpoints = endpoints
-        self.formatter = formatter
+    def __init__(self, formatter: Formatter, endpoints: NamedTuple):
+        super().__init__(
+            {
+                key: partial(formatter.format, endpoint)
+                for key, endpoint in endpoints._asdict().items()
+            }
+        )
+        # bypass AttrDict.__setattr__, these are slots and not endpoints
+        object.__setattr__(self, "endpoints", endpoints)
+        object.__setattr__(self, "formatter", formatter)
 
     def __dir__(self):
-        return dir(type(self)) + list(self.endpoints)
-
-    def __getattr__(self, key):
-        if key in self.__slots__:
-            return super().__getattr__(key)
-        if key in self.endpoints:
-            # maybe add repr in the future
-            return lambda *args, **kwargs: self.formatter.format(
-                self.endpoints[key], *args, **kwargs
-            )
-        if hasattr(super(), "__getattr__"):
-            return super().__getattr__(key)
-        raise AttributeError(
-            f"type object '{type(self).__name__}' has no attribute '{key}'"
-        )
+        return dir(type(self)) + list(self.endpoints._fields)
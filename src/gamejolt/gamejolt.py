@@ -1,11 +1,9 @@
-"""This module provides the GameJolt class for interacting with the Game Jolt API."""
+"""
+This module provides the GameJolt class for interacting with the Game Jolt API.
 
-from .requester import RequesterAbstract
-from .subcomponents import UsersComponent
+Kept for backwards compatibility, the class is defined in the package itself.
+"""
 
+from . import GameJolt
 
-# pylint: disable=W0223
-class GameJolt(RequesterAbstract):
-    def __init__(self, key: str, *args, **kw) -> None:
-        super().__init__(key, *args, **kw)
-        self.users = UsersComponent(self)
+__all__ = ["GameJolt"]
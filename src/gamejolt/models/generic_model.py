@@ -1,10 +1,22 @@
 """Generic dataclass for arbitrary data."""
 
-import inspect
-from dataclasses import dataclass
+from dataclasses import MISSING, Field, dataclass, fields
+from typing import Callable, ClassVar
 
 
-@dataclass
+def as_int(value) -> int:
+    """
+    Converts a value from the API to an int, skipping the call when it already is one.
+
+    :param value: The value to convert.
+    :return: The value as an int.
+    :rtype: int
+    """
+    # pylint: disable-next=unidiomatic-typecheck
+    return value if type(value) is int else int(value)
+
+
+@dataclass(slots=True)
 class GenericModel:
     """
     A dataclass that can be used to model arbitrary data.
@@ -19,6 +31,100 @@ class GenericModel:
         attribute values are the values of the dictionary.
     """
 
+    # field name -> callable applied to the raw API value by `from_dict` and `from_list`
+    _converters: ClassVar[dict[str, Callable]] = {}
+
+    @classmethod
+    def _field_read(cls, f: Field, namespace: dict) -> str | None:
+        """
+        Returns the expression the generated constructors use to read a field.
+
+        Init fields are read from `data`, applying `_converters` and falling back to the
+        field defaults, other fields are set to their defaults. The converters and
+        defaults the expression refers to are added to the namespace.
+
+        :param f: The field to read.
+        :type f: Field
+        :param namespace: The namespace the constructor is generated in.
+        :type namespace: dict
+        :return: The expression, or None for a field without a value to set.
+        :rtype: str | None
+        """
+        if f.init:
+            read = f"data[{f.name!r}]"
+            if f.name in cls._converters:
+                namespace[f"_convert_{f.name}"] = cls._converters[f.name]
+                read = f"_convert_{f.name}({read})"
+            if f.default is not MISSING:
+                namespace[f"_default_{f.name}"] = f.default
+                return f"{read} if {f.name!r} in data else _default_{f.name}"
+            if f.default_factory is not MISSING:
+                namespace[f"_factory_{f.name}"] = f.default_factory
+                return f"{read} if {f.name!r} in data else _factory_{f.name}()"
+            return read
+        if f.default is not MISSING:
+            namespace[f"_default_{f.name}"] = f.default
+            return f"_default_{f.name}"
+        if f.default_factory is not MISSING:
+            namespace[f"_factory_{f.name}"] = f.default_factory
+            return f"_factory_{f.name}()"
+        return None
+
+    @classmethod
+    def _dict_constructor(cls) -> Callable[[dict], "GenericModel"]:
+        """
+        Returns a function building an instance of the class from a dictionary.
+
+        The function is generated once per class: it reads every constructor field
+        straight from the dictionary (applying `_converters`, falling back to the field
+        defaults) and calls the constructor with them, with no reflection per call.
+
+        :return: The generated constructor.
+        :rtype: Callable[[dict], GenericModel]
+        """
+        constructor = cls.__dict__.get("_from_dict_fast")
+        if constructor is not None:
+            return constructor
+
+        namespace = {"cls": cls}
+        args = [
+            f"{f.name}={cls._field_read(f, namespace)}" for f in fields(cls) if f.init
+        ]
+        source = f"def _from_dict_fast(data):\n    return cls({', '.join(args)})\n"
+        exec(source, namespace)  # pylint: disable=exec-used
+        constructor = cls._from_dict_fast = namespace["_from_dict_fast"]
+        return constructor
+
+    @classmethod
+    def _bare_constructor(cls) -> Callable[[dict], "GenericModel"]:
+        """
+        Returns a function building an instance of the class from a dictionary without `__init__`.
+
+        Like `_dict_constructor`, the function is generated once per class, but it
+        allocates a bare instance and assigns every field straight from the dictionary
+        (applying `_converters`, falling back to the field defaults), then calls
+        `__post_init__` if the class defines one. Used on the bulk `from_list` path.
+
+        :return: The generated constructor.
+        :rtype: Callable[[dict], GenericModel]
+        """
+        constructor = cls.__dict__.get("_from_dict_bare")
+        if constructor is not None:
+            return constructor
+
+        namespace = {"cls": cls, "new": object.__new__}
+        lines = ["def _from_dict_bare(data):", "    inst = new(cls)"]
+        for f in fields(cls):
+            read = cls._field_read(f, namespace)
+            if read is not None:
+                lines.append(f"    inst.{f.name} = {read}")
+        if hasattr(cls, "__post_init__"):
+            lines.append("    inst.__post_init__()")
+        lines.append("    return inst")
+        exec("\n".join(lines) + "\n", namespace)  # pylint: disable=exec-used
+        constructor = cls._from_dict_bare = namespace["_from_dict_bare"]
+        return constructor
+
     @classmethod
     def from_dict(cls, data: dict):
         """
@@ -29,9 +135,12 @@ class GenericModel:
         :return: An instance of the class initialized with the provided dictionary data.
         :rtype: GenericModel
         """
-        return cls(
-            **{k: v for k, v in data.items() if k in inspect.signature(cls).parameters}
-        )
+        try:
+            return cls._dict_constructor()(data)
+        except KeyError as e:
+            raise TypeError(
+                f"{cls.__name__}() missing required field: {e.args[0]!r}"
+            ) from None
 
     @classmethod
     def from_list(cls, data: list[dict]):
@@ -43,4 +152,11 @@ class GenericModel:
         :return: A list of instances of the class initialized with the provided dictionary data.
         :rtype: list[GenericModel]
         """
-        return [cls.from_dict(d) for d in data]
+        make = cls._bare_constructor()
+        try:
+            # map() runs the loop in C, skipping the comprehension frame and its bytecode loop
+            return list(map(make, data))
+        except KeyError as e:
+            raise TypeError(
+                f"{cls.__name__}() missing required field: {e.args[0]!r}"
+            ) from None
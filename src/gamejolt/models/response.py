@@ -2,7 +2,7 @@ from dataclasses import dataclass, field
 from . import GenericModel
 
 
-@dataclass
+@dataclass(slots=True)
 class Response(GenericModel):
     """
     Represents a response from the Game Jolt API.
@@ -7,7 +7,7 @@ from datetime import datetime
 from . import GenericModel
 
 
-@dataclass
+@dataclass(slots=True)
 class Time(GenericModel):
     """
     Represents Time
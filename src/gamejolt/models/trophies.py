@@ -3,10 +3,11 @@ This module defines the Trophy model for representing trophies within the Game J
 """
 
 from dataclasses import dataclass, field
-from . import GenericModel
+from typing import Callable, ClassVar
+from .generic_model import GenericModel, as_int
 
 
-@dataclass
+@dataclass(slots=True)
 class Trophy(GenericModel):
     """
     Represents Trophy
@@ -21,6 +22,9 @@ class Trophy(GenericModel):
         difficulty (str): The difficulty of the trophy. Can be Bronze, Silver, Gold, or Platinum.
         image_url (str): The URL of the trophy's thumbnail image.
         achieved (bool or str): Date/time when the trophy was achieved by the user, or False if they haven't achieved it yet.
+
+    `from_dict` and `from_list` cast the id to an int, constructing a Trophy directly
+    (e.g. `Trophy(id="5", ...)`) keeps the id as given.
     """
 
     id: int
@@ -30,5 +34,5 @@ class Trophy(GenericModel):
     image_url: str = field(repr=False)
     achieved: bool | str
 
-    def __post_init__(self):
-        self.id = int(self.id)
+    # the API sends ids as strings, cast once while parsing instead of in __post_init__
+    _converters: ClassVar[dict[str, Callable]] = {"id": as_int}
@@ -3,10 +3,11 @@ This module defines the User model for representing users within the Game Jolt A
 """
 
 from dataclasses import dataclass, field
-from . import GenericModel
+from typing import Callable, ClassVar
+from .generic_model import GenericModel, as_int
 
 
-@dataclass
+@dataclass(slots=True)
 class User(GenericModel):
     """
     Represents User
@@ -27,6 +28,9 @@ class User(GenericModel):
         developer_name (str): The user's display name.
         developer_website (str): The user's website (or empty string if not specified)
         developer_description (str): The user's profile markdown description.
+
+    `from_dict` and `from_list` cast the id to an int, constructing a User directly
+    (e.g. `User(id="5", ...)`) keeps the id as given.
     """
 
     id: int
@@ -43,8 +47,8 @@ class User(GenericModel):
     developer_description: str | None = field(default=None, repr=False)
     token: str | None = field(default=None, repr=False)
 
-    def __post_init__(self):
-        self.id = int(self.id)
+    # the API sends ids as strings, cast once while parsing instead of in __post_init__
+    _converters: ClassVar[dict[str, Callable]] = {"id": as_int}
 
     def set_token(self, token: str):
         """Sets the token of the user.
@@ -8,15 +8,30 @@ parameters, and evaluating the responses of API requests.
 
 Classes:
     RequesterAbstract: An abstract base class for making requests to the Game Jolt API.
+    SessionRequester: A requester sending requests through a pooled HTTP session.
+    ReplayRequester: A requester recording responses to a file and replaying them.
     Response: Represents a response from a request to the Game Jolt API.
 
 Functions:
     generate_signature(url: str, key: str) -> str: Generates a signature for a URL and key.
 """
 
+import binascii
 import hashlib
+import json
+import os
+import threading
 
-from .endpoints import Formatter, format_queries, supported_formats
+try:  # optional, faster JSON parser
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+from .endpoints import (
+    Formatter,
+    supported_formats,
+    supported_formats_order,
+)
 from .models import Response
 from .errors import ApiError
 
@@ -32,7 +47,7 @@ def generate_signature(url: str, key: str) -> str:
     :return: The generated signature.
     :rtype: str
     """
-    return hashlib.md5((url + key).encode("ascii")).hexdigest()
+    return hashlib.md5((url + key).encode("ascii"), usedforsecurity=False).hexdigest()
 
 
 class RequesterAbstract(Formatter):
@@ -60,12 +75,61 @@ class RequesterAbstract(Formatter):
         """
         Generates the signature for the provided URL and key.
 
+        The hash state of the constant base URL prefix is precomputed, so only the
+        rest of the URL and the key are hashed per request.
+
         :param url: The URL of the request
         :type url: str
         :return: The generated signature.
         :rtype: str
         """
-        return generate_signature(url, self.private_key)
+        if url.startswith(self._url_prefix):
+            md5 = self._prefix_md5.copy()
+            md5.update(url[len(self._url_prefix) :].encode("ascii"))
+        else:
+            md5 = hashlib.md5(url.encode("ascii"), usedforsecurity=False)
+        md5.update(self._key_bytes)
+        return md5.hexdigest()
+
+    def sign_many(self, urls: list[str]) -> list[str]:
+        """
+        Generates the signatures of many URLs at once.
+
+        Meant for bulk operations, the attribute lookups are done once per batch. The
+        raw digests are collected in a single buffer and hex encoded in one call.
+
+        :param urls: The URLs of the requests.
+        :type urls: list[str]
+        :return: The generated signatures, in the same order as the URLs.
+        :rtype: list[str]
+        """
+        prefix, prefix_md5, key_bytes = (
+            self._url_prefix,
+            self._prefix_md5,
+            self._key_bytes,
+        )
+        prefix_len = len(prefix)
+        digests = bytearray()
+        for url in urls:
+            if url.startswith(prefix):
+                md5 = prefix_md5.copy()
+                md5.update(url[prefix_len:].encode("ascii"))
+            else:
+                md5 = hashlib.md5(url.encode("ascii"), usedforsecurity=False)
+            md5.update(key_bytes)
+            digests += md5.digest()
+        hex_digests = binascii.hexlify(digests).decode("ascii")
+        return [hex_digests[i : i + 32] for i in range(0, len(hex_digests), 32)]
+
+    @property
+    def private_key(self) -> str:
+        """The private key to be used for generating request signatures."""
+        return self._private_key
+
+    @private_key.setter
+    def private_key(self, key: str) -> None:
+        self._private_key = key
+        self._key_bytes = key.encode("ascii")
 
     def __init__(
         self, key: str, *, game: int | str, response_format: str = "json", **kwargs
@@ -88,10 +152,14 @@ class RequesterAbstract(Formatter):
         if response_format not in supported_formats:
             raise ValueError(
                 f"Invalid response format: {response_format}. "
-                f"Supported formats are: {', '.join(supported_formats)}"
+                f"Supported formats are: {', '.join(supported_formats_order)}"
             )
         super().__init__(game_id=game, format=response_format, **kwargs)
+        self._base_format = super().format  # skip the super() lookup per request
         self.private_key = key
+        self._prefix_md5 = hashlib.md5(
+            self._url_prefix.encode("ascii"), usedforsecurity=False
+        )
 
     def format_signature(self, url: str) -> str:
         """
@@ -102,7 +170,8 @@ class RequesterAbstract(Formatter):
         :param url: The url to append the signature to.
         :return: The url with the signature appended.
         """
-        return "&".join((url, format_queries(signature=self.generate_signature(url))))
+        # hex digests are always URL-safe, no need to encode them
+        return f"{url}&signature={self.generate_signature(url)}"
 
     def format(self, endpoint: str = "", **queries: dict[str, str]) -> str:
         """
@@ -116,7 +185,7 @@ class RequesterAbstract(Formatter):
         :type queries: dict[str, str]
         :return: The url with the signature appended.
         """
-        return self.format_signature(super().format(endpoint, **queries))
+        return self.format_signature(self._base_format(endpoint, **queries))
 
     def post(self, url: str) -> Response:
         """
@@ -128,17 +197,31 @@ class RequesterAbstract(Formatter):
 
         :raise ApiError: If the request was not successful.
         """
-        response = self._post(url)
-        evaled_response = self.evaluate(response)
+        evaled_response = self._request(url)
         response_model = Response.from_dict(evaled_response)
         if not evaled_response["success"]:
             raise ApiError(evaled_response["message"], response=response_model)
         return response_model
 
+    def _request(self, url: str) -> dict:
+        """
+        Makes a POST request to the provided url and parses its response.
+
+        :param url: The url to make the request to.
+        :return: The parsed response, see `evaluate`.
+        :rtype: dict
+        """
+        return self.evaluate(self._post(url))
+
     def _post(self, url: str) -> any:
         """
         Makes a POST request to the provided url.
 
+        Implementations should send every request through a single pooled client
+        (e.g. a `requests.Session` created once per requester) so the connection is
+        kept alive between calls instead of paying a TCP/TLS handshake per request,
+        and release it in `close`.
+
         :param url: The url to make the request to.
         :return: The response of the request.
         :rtype: any
@@ -164,3 +247,207 @@ class RequesterAbstract(Formatter):
         :rtype: dict
         """
         raise NotImplementedError()
+
+    def close(self) -> None:
+        """
+        Releases the resources held by the requester.
+
+        Does nothing by default, subclasses holding a connection pool should
+        override it to close the pool.
+        """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class SessionRequester(RequesterAbstract):
+    """
+    Requester sending every request through a single pooled HTTP session.
+
+    The session keeps connections to the API alive between requests, so only the
+    first request pays the TCP/TLS handshake. By default a `requests.Session` is
+    created (`requests` is only imported then), any client with a compatible
+    `post(url, timeout=...)` method returning a response with the raw body in
+    `.content` can be passed instead. Only the json response format is supported,
+    the body is parsed with orjson when it is installed.
+
+    Mix it into GameJolt to get a ready to use client::
+
+        class Client(GameJolt, SessionRequester):
+            pass
+
+    An `httpx.Client(http2=True)` can be passed as the session to multiplex the
+    concurrent bulk methods over a single connection.
+
+    Attributes
+    -----------
+        session: The HTTP client the requests are sent through.
+        timeout (float): The timeout of every request, in seconds.
+    """
+
+    def __init__(self, key: str, *args, session=None, timeout: float = 10, **kwargs):
+        """
+        Initializes a new instance of the SessionRequester class.
+
+        :param key: The private key to be used for generating request signatures.
+        :type key: str
+        :param session: The HTTP client to send the requests through. (optional)
+        :param timeout: The timeout of every request, in seconds. Defaults to 10.
+        :type timeout: float
+        :param kwargs: Additional keyword arguments to be passed to the parent class initializer.
+        :type kwargs: dict
+
+        :raise ValueError: If the response format is not json.
+        """
+        super().__init__(key, *args, **kwargs)
+        if self.queries["format"] != "json":
+            raise ValueError(
+                f"{type(self).__name__} only supports the json response format"
+            )
+        if session is None:
+            # pylint: disable=import-outside-toplevel
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+        self.session = session
+        self.timeout = timeout
+
+    def _post(self, url: str) -> any:
+        return self.session.post(url, timeout=self.timeout)
+
+    def evaluate(self, response: any) -> dict:
+        body: dict = json_loads(response.content)["response"]
+        return {
+            # the API sends booleans as the strings "true" and "false"
+            "success": body["success"] in (True, "true"),
+            "response": body,
+            "message": body.get("message"),
+        }
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class ReplayRequester(RequesterAbstract):
+    """
+    Requester recording the parsed responses to a JSON file and replaying them.
+
+    Meant for tests and local development: a recorded run replays every request
+    from the file instead of going over the network. The mode is taken from the
+    `GAMEJOLT_RECORD` environment variable unless given explicitly:
+
+        - live: requests go over the network, nothing is recorded. (default)
+        - record: requests go over the network, their responses are saved.
+        - replay: responses are read from the file, no request is made.
+
+    Responses are keyed by the URL without its `user_token` and `signature`
+    queries, so a replay needs the same game and queries as the recording but no
+    user token is written to the file. The recorded responses themselves are kept
+    as is, including any data store values. In record mode the file is written
+    once, by `close`. Mix it in before the requester doing the actual requests and
+    use the client as a context manager::
+
+        class Client(GameJolt, ReplayRequester, SessionRequester):
+            pass
+
+        with Client(...) as client:
+            ...
+
+    Attributes
+    -----------
+        record_path (str): The JSON file the responses are recorded to.
+        record_mode (str): One of "live", "record" or "replay".
+    """
+
+    record_modes = ("live", "record", "replay")
+
+    def __init__(
+        self,
+        key: str,
+        *args,
+        record_path: str = "gamejolt_responses.json",
+        record_mode: str | None = None,
+        **kwargs,
+    ):
+        """
+        Initializes a new instance of the ReplayRequester class.
+
+        :param key: The private key to be used for generating request signatures.
+        :type key: str
+        :param record_path: The JSON file the responses are recorded to. (default: "gamejolt_responses.json")
+        :type record_path: str
+        :param record_mode: The mode, defaults to the GAMEJOLT_RECORD environment variable or "live".
+        :type record_mode: str | None
+        :param kwargs: Additional keyword arguments to be passed to the parent class initializer.
+        :type kwargs: dict
+
+        :raise ValueError: If the mode is not supported.
+        """
+        super().__init__(key, *args, **kwargs)
+        if record_mode is None:
+            record_mode = os.environ.get("GAMEJOLT_RECORD", "live")
+        if record_mode not in self.record_modes:
+            raise ValueError(
+                f"Invalid record mode: {record_mode}. "
+                f"Supported modes are: {', '.join(self.record_modes)}"
+            )
+        self.record_path = record_path
+        self.record_mode = record_mode
+        self._recorded: dict[str, dict] = {}
+        # the bulk methods record from worker threads
+        self._recorded_lock = threading.Lock()
+        if record_mode != "live" and os.path.exists(record_path):
+            with open(record_path, encoding="utf-8") as file:
+                self._recorded = json.load(file)
+
+    @staticmethod
+    def _record_key(url: str) -> str:
+        """
+        Returns the key a response is recorded under.
+
+        :param url: The signed URL of the request.
+        :type url: str
+        :return: The URL without its `user_token` and `signature` queries.
+        :rtype: str
+        """
+        base, _, query = url.partition("?")
+        return (
+            base
+            + "?"
+            + "&".join(
+                item
+                for item in query.split("&")
+                if item.partition("=")[0] not in ("user_token", "signature")
+            )
+        )
+
+    def _request(self, url: str) -> dict:
+        key = self._record_key(url)
+        if self.record_mode == "replay":
+            try:
+                return self._recorded[key]
+            except KeyError:
+                raise LookupError(
+                    f"No response recorded for {key} in {self.record_path}"
+                ) from None
+        evaled_response = super()._request(url)
+        if self.record_mode == "record":
+            with self._recorded_lock:
+                self._recorded[key] = evaled_response
+        return evaled_response
+
+    def close(self) -> None:
+        """
+        Writes the recorded responses to `record_path` in record mode, then closes
+        the requester doing the actual requests.
+        """
+        if self.record_mode == "record":
+            with self._recorded_lock:
+                with open(self.record_path, "w", encoding="utf-8") as file:
+                    json.dump(self._recorded, file, indent=2)
+        super().close()
@@ -1,6 +1,8 @@
 """This module provides the Generic component for all subcomponents."""
 
 from .. import RequesterAbstract
+from ..constants import VERSIONS, V1_2
+from .helpers import TTLCache
 
 
 # pylint: disable=too-few-public-methods
@@ -9,5 +11,44 @@ class Component:
     Generic Component
     """
 
+    __slots__ = ("requester", "_api_version_num", "_min_v1_2_ok")
+
     def __init__(self, requester: RequesterAbstract) -> None:
         self.requester = requester
+        # the API version is fixed per requester, resolve it once
+        self._api_version_num = VERSIONS[requester.api_version]
+        self._min_v1_2_ok = self._api_version_num >= V1_2
+
+
+class CachedComponent(Component):
+    """
+    Generic Component keeping some responses in a `TTLCache`
+
+    The cache is off unless a `cache_ttl` is given, either to the constructor or
+    later on the instance.
+
+    Attributes
+    -----------
+        cache_size (int): The maximum number of entries kept.
+    """
+
+    __slots__ = ("_cache",)
+
+    cache_size = 256
+
+    def __init__(self, requester: RequesterAbstract, cache_ttl: float = 0.0) -> None:
+        super().__init__(requester)
+        self._cache = TTLCache(maxsize=self.cache_size, ttl=cache_ttl)
+
+    @property
+    def cache_ttl(self) -> float:
+        """How long responses are reused, in seconds. 0 disables the cache.
+
+        Setting it drops the entries cached so far.
+        """
+        return self._cache.ttl
+
+    @cache_ttl.setter
+    def cache_ttl(self, ttl: float) -> None:
+        self._cache.ttl = ttl
+        self._cache.clear()
@@ -1,52 +1,68 @@
 """This module provides the Data Store component for interacting with the Game Jolt API."""
 
-from typing import overload, Optional
-from ..models import User
+from functools import partial
+from operator import itemgetter
+from typing import Iterable, Iterator, Mapping, overload, Optional
+from ..models import Response, User
 from .component import Component
 
-from .helpers import token_required, api_version_guard, VERSIONS
+from .helpers import guarded, token_required, api_version_guard, map_concurrently
 
-GetKeysResult = list[dict[str, str]] | str
+GetKeysResult = list[str]
 
+_extract_key = itemgetter("key")
 
-class DataStoreComponent(Component):
+
+def _params_from_user(user: User, key_value: str, key_name: str = "key") -> dict:
     """
-    Data Store Component
+    Builds the parameters of a request made for a user.
+
+    :param user: The user the request is made for.
+    :type user: User
+    :param key_value: The value of the key parameter.
+    :type key_value: str
+    :param key_name: The name of the key parameter. (default: "key")
+    :type key_name: str
+    :return: The parameters of the request.
+    :rtype: dict[str, str]
+    :raises ValueError: If the user has no token or the key is None.
+    """
+    if user.token is None:
+        raise ValueError("User must have a token set.")
+    if key_value is None:
+        raise ValueError(f"{key_name.capitalize()} must be provided.")
+    return {key_name: key_value, "username": user.username, "user_token": user.token}
 
-    This component handles fetching, setting, removing, updating and getting keys from the Game Jolt API.
+
+def _params_from_key(key_value: str, key_name: str = "key") -> dict:
+    """
+    Builds the parameters of a global request.
+
+    :param key_value: The value of the key parameter.
+    :type key_value: str
+    :param key_name: The name of the key parameter. (default: "key")
+    :type key_name: str
+    :return: The parameters of the request.
+    :rtype: dict[str, str]
+    :raises ValueError: If the key is None.
     """
+    if key_value is None:
+        raise ValueError(f"{key_name.capitalize()} must be provided.")
+    return {key_name: key_value}
 
-    def __user_or_key_checker(
-        self, user_or_key: User | str, key_value: str, key_name: str
-    ) -> dict[str, str]:
-        """
-        Checks if the first parameter is a user or a str, and builds a parameter dictionary accordingly.
-        used in overload functions to either assign user auth or the key to the parameter dictionary
 
-        :param user_or_key: A User or a str. If a User, it will be the user to get the key from/for. If a str, it will be the key.
-        :type user_or_key: User | str
-        :param key_value: The value for the key.
-        :type key_value: str
-        :param key_name: The name of the key to be used in the parameter dictionary.
-        :type key_name: str
-        :return: A dictionary with the parameters.
-        :rtype: dict[str, str]
-        """
-        params = {key_name: key_value}
+class DataStoreComponent(Component):
+    """
+    Data Store Component
 
-        if isinstance(user_or_key, User):  # it's a user
-            user = user_or_key  # assist for the reader
-            params["username"] = user.username
-            params["user_token"] = user.token
+    This component handles fetching, setting, removing, updating and getting keys from the Game Jolt API.
 
-            if user.token is None:
-                raise ValueError("User must have a token set.")
-        else:  # it's a key
-            params[key_name] = user_or_key
+    Every operation has a user and a global variant (`fetch_user`/`fetch_global`, ...),
+    prefer them when the kind of item is known at the call site, the generic methods
+    only dispatch to them on the type of their first argument.
+    """
 
-        if params[key_name] is None:
-            raise ValueError(f"{key_name.capitalize()} must be provided.")
-        return params
+    __slots__ = ()
 
     @overload
     def fetch(self, key: str) -> str:
@@ -84,10 +100,60 @@ class DataStoreComponent(Component):
         :return: The data item as a string.
         :rtype: str
         """
+        if isinstance(user_or_key, User):
+            return self.fetch_user(user_or_key, key)
+        return self.fetch_global(user_or_key)
+
+    def fetch_user(self, user: User, key: str) -> str:
+        """
+        Fetches data from the data store for a user.
 
-        params = self.__user_or_key_checker(user_or_key, key, "key")
+        :param user: The user to fetch the data for.
+        :type user: User
+        :param key: The key of the data item to fetch.
+        :type key: str
+        :return: The data item as a string.
+        :rtype: str
+        """
+        return self.requester.post(
+            self.requester.DATASTORE.FETCH(**_params_from_user(user, key))
+        )
+
+    def fetch_global(self, key: str) -> str:
+        """
+        Fetches data from the data store globally.
+
+        :param key: The key of the data item to fetch.
+        :type key: str
+        :return: The data item as a string.
+        :rtype: str
+        """
+        return self.requester.post(
+            self.requester.DATASTORE.FETCH(**_params_from_key(key))
+        )
+
+    def fetch_many(
+        self, keys: Iterable[str], user: User | None = None, max_workers: int = 8
+    ) -> list[str]:
+        """
+        Fetches many data items concurrently, globally or for a user.
 
-        return self.requester.post(self.requester.DATASTORE.FETCH(**params))
+        The requests run through `helpers.map_concurrently`, see it for the requester to use.
+
+        :param keys: The keys of the data items to fetch.
+        :type keys: Iterable[str]
+        :param user: The user to fetch the data for, fetches globally if None. (default: None)
+        :type user: User | None
+        :param max_workers: The maximum number of requests in flight. (default: 8)
+        :type max_workers: int
+        :return: The data items, in the order of the keys.
+        :rtype: list[str]
+        """
+        if user is not None:
+            fetch = partial(self.fetch_user, user)
+        else:
+            fetch = self.fetch_global
+        return map_concurrently(fetch, keys, max_workers=max_workers)
 
     @overload
     @token_required
@@ -125,16 +191,61 @@ class DataStoreComponent(Component):
         :param data: If user_or_key is a User, this is the data to set.
         :type data: str
         """
-        params = self.__user_or_key_checker(user_or_key, key_or_data, "key")
+        if isinstance(user_or_key, User):
+            self.set_user(user_or_key, key_or_data, data)
+        else:  # key_or_data is data and user_or_key is key
+            self.set_global(user_or_key, key_or_data)
+
+    def set_user(self, user: User, key: str, data: str):
+        """
+        Sets data in the data store for a user.
+
+        :param user: The user to set the data for.
+        :type user: User
+        :param key: The key of the data item to set.
+        :type key: str
+        :param data: The data to set.
+        :type data: str
+        """
+        self.requester.post(
+            self.requester.DATASTORE.SET(**_params_from_user(user, key), data=data)
+        )
+
+    def set_global(self, key: str, data: str):
+        """
+        Sets data in the data store globally.
+
+        :param key: The key of the data item to set.
+        :type key: str
+        :param data: The data to set.
+        :type data: str
+        """
+        self.requester.post(
+            self.requester.DATASTORE.SET(**_params_from_key(key), data=data)
+        )
+
+    def set_many(
+        self, items: Mapping[str, str], user: User | None = None, max_workers: int = 8
+    ):
+        """
+        Sets many data items concurrently, globally or for a user.
 
-        if isinstance(
-            user_or_key, User
-        ):  # that means key_or_data is key, and user_or_key is user, and data is data
-            params["data"] = data
-        else:  # otherwise key_or_data is data and user_or_key is key
-            params["data"] = key_or_data
+        The requests run through `helpers.map_concurrently`, see it for the requester to use.
 
-        self.requester.post(self.requester.DATASTORE.SET(**params))
+        :param items: The data to set, by key.
+        :type items: Mapping[str, str]
+        :param user: The user to set the data for, sets globally if None. (default: None)
+        :type user: User | None
+        :param max_workers: The maximum number of requests in flight. (default: 8)
+        :type max_workers: int
+        """
+        if user is not None:
+            set_item = partial(self.set_user, user)
+        else:
+            set_item = self.set_global
+        map_concurrently(
+            set_item, items.keys(), items.values(), max_workers=max_workers
+        )
 
     @overload
     def update(self, key: str, operation: str, value: str | int):
@@ -179,19 +290,47 @@ class DataStoreComponent(Component):
         :param value: If user_or_key is a User, this is the value to apply to the data item. Otherwise, it is the operation.
         :type value: str
         """
-
-        params = self.__user_or_key_checker(user_or_key, operation_or_key, "key")
-
         if isinstance(user_or_key, User):
             operation, value = args
-            params["operation"] = operation
-            params["value"] = value
-        else:
-            value, *_ = args
-            params["operation"] = operation_or_key
-            params["value"] = value
+            return self.update_user(user_or_key, operation_or_key, operation, value)
+        value, *_ = args
+        return self.update_global(user_or_key, operation_or_key, value)
+
+    def update_user(self, user: User, key: str, operation: str, value: str | int):
+        """
+        Updates data in the data store for a user.
+
+        :param user: The user to update the data for.
+        :type user: User
+        :param key: The key of the data item to update.
+        :type key: str
+        :param operation: The operation to apply to the data item.
+        :type operation: str
+        :param value: The value to apply to the data item.
+        :type value: str | int
+        """
+        return self.requester.post(
+            self.requester.DATASTORE.UPDATE(
+                **_params_from_user(user, key), operation=operation, value=value
+            )
+        )
 
-        return self.requester.post(self.requester.DATASTORE.UPDATE(**params))
+    def update_global(self, key: str, operation: str, value: str | int):
+        """
+        Updates data in the data store globally.
+
+        :param key: The key of the data item to update.
+        :type key: str
+        :param operation: The operation to apply to the data item.
+        :type operation: str
+        :param value: The value to apply to the data item.
+        :type value: str | int
+        """
+        return self.requester.post(
+            self.requester.DATASTORE.UPDATE(
+                **_params_from_key(key), operation=operation, value=value
+            )
+        )
 
     @overload
     def remove(self, key: str):
@@ -223,10 +362,56 @@ class DataStoreComponent(Component):
         :param key: The key of the data item to remove. used if user_or_key is a User
         :type key: str
         """
+        if isinstance(user_or_key, User):
+            return self.remove_user(user_or_key, key)
+        return self.remove_global(user_or_key)
+
+    def remove_user(self, user: User, key: str):
+        """
+        Removes data from the data store for a user.
+
+        :param user: The user to remove the data for.
+        :type user: User
+        :param key: The key of the data item to remove.
+        :type key: str
+        """
+        return self.requester.post(
+            self.requester.DATASTORE.REMOVE(**_params_from_user(user, key))
+        )
 
-        params = self.__user_or_key_checker(user_or_key, key, "key")
+    def remove_global(self, key: str):
+        """
+        Removes data from the data store globally.
+
+        :param key: The key of the data item to remove.
+        :type key: str
+        """
+        return self.requester.post(
+            self.requester.DATASTORE.REMOVE(**_params_from_key(key))
+        )
+
+    def remove_many(
+        self, keys: Iterable[str], user: User | None = None, max_workers: int = 8
+    ) -> list[Response]:
+        """
+        Removes many data items concurrently, globally or for a user.
 
-        return self.requester.post(self.requester.DATASTORE.REMOVE(**params))
+        The requests run through `helpers.map_concurrently`, see it for the requester to use.
+
+        :param keys: The keys of the data items to remove.
+        :type keys: Iterable[str]
+        :param user: The user to remove the data for, removes globally if None. (default: None)
+        :type user: User | None
+        :param max_workers: The maximum number of requests in flight. (default: 8)
+        :type max_workers: int
+        :return: The responses, in the order of the keys.
+        :rtype: list[Response]
+        """
+        if user is not None:
+            remove = partial(self.remove_user, user)
+        else:
+            remove = self.remove_global
+        return map_concurrently(remove, keys, max_workers=max_workers)
 
     @overload
     def get_keys(self) -> GetKeysResult:
@@ -234,10 +419,9 @@ class DataStoreComponent(Component):
         Gets a list of keys from the data store globally.
 
         :return: A list of keys from the data store.
-        :rtype: list[dict[str, str]] | str
+        :rtype: list[str]
 
-        return a string if there is no keys or a list of dictionaries
-        example: [{"key":"test"},{"key":"version"}]
+        example: ["test", "version"]
         """
 
     @overload
@@ -249,10 +433,9 @@ class DataStoreComponent(Component):
         :param user: The user to get the keys for.
         :type user: User
         :return: A list of keys from the data store.
-        :rtype: list[dict[str, str]] | str
+        :rtype: list[str]
 
-        return a string if there is no keys or a list of dictionaries
-        example: [{"key":"test"},{"key":"version"}]
+        example: ["test", "version"]
         """
 
     @overload
@@ -264,15 +447,13 @@ class DataStoreComponent(Component):
         :param pattern: The pattern to apply to the key names in the data store.
         :type pattern: str
         :return: A list of keys from the data store.
-        :rtype: list[dict[str, str]] | str
+        :rtype: list[str]
 
-        return a string if there is no keys or a list of dictionaries
-        example: [{"key":"test"},{"key":"version"}]
+        example: ["test", "version"]
         """
 
     @overload
-    @api_version_guard("v1_2")
-    @token_required
+    @guarded("v1_2", token=True)
     def get_keys(self, user: User, pattern: str = "*") -> GetKeysResult:
         """
         Gets a list of keys from the data store.
@@ -282,38 +463,106 @@ class DataStoreComponent(Component):
         :param pattern: The pattern to apply to the key names in the data store.
         :type pattern: str
         :return: A list of keys from the data store.
-        :rtype: list[dict[str, str]] | str
+        :rtype: list[str]
 
-        return a string if there is no keys or a list of dictionaries
-        example: [{"key":"test"},{"key":"version"}]
+        example: ["test", "version"]
         """
 
     def get_keys(
-        self, user_or_pattern: User | str, pattern: Optional[str] = None
+        self, user_or_pattern: User | str | None = None, pattern: Optional[str] = None
     ) -> GetKeysResult:
         """
         Gets a list of keys from the data store.
 
-        :param user_or_pattern: The user to get the keys for. If None, gets globally.
-        :type user_or_pattern: User
+        :param user_or_pattern: The user to get the keys for, or the pattern when getting globally.
+        :type user_or_pattern: User | str | None
         :param pattern: The pattern to apply to the key names in the data store.
         :type pattern: str
         :return: A list of keys from the data store.
-        :rtype: list[dict[str, str]] | str
+        :rtype: list[str]
+
+        example: ["test", "version"]
+
+        """
+        if isinstance(user_or_pattern, User):
+            return self.get_keys_user(user_or_pattern, pattern)
+        # the global overload takes the pattern first, but it can be passed by keyword
+        return self.get_keys_global(
+            pattern if user_or_pattern is None else user_or_pattern
+        )
+
+    def get_keys_user(self, user: User, pattern: Optional[str] = None) -> GetKeysResult:
+        """
+        Gets a list of keys from the data store for a user.
+
+        :param user: The user to get the keys for.
+        :type user: User
+        :param pattern: The pattern to apply to the key names, requires API version v1_2. (optional)
+        :type pattern: str
+        :return: A list of keys from the data store.
+        :rtype: list[str]
+        """
+        return list(self._iter_keys_from(self._post_get_keys_user(user, pattern)))
+
+    def get_keys_global(self, pattern: Optional[str] = None) -> GetKeysResult:
+        """
+        Gets a list of keys from the data store globally.
+
+        :param pattern: The pattern to apply to the key names, requires API version v1_2. (optional)
+        :type pattern: str
+        :return: A list of keys from the data store.
+        :rtype: list[str]
+        """
+        return list(self._iter_keys_from(self._post_get_keys_global(pattern)))
+
+    def iter_keys(
+        self, user_or_pattern: User | str | None = None, pattern: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Gets the keys from the data store, lazily.
 
-        return a string if there is no keys or a list of dictionaries
-        example: [{"key":"test"},{"key":"version"}]
+        Takes the same arguments as `get_keys`. The request is made right away and the
+        whole response is parsed, only the unwrapping of each key from its `{"key": ...}`
+        entry is deferred until it is iterated.
 
+        :param user_or_pattern: The user to get the keys for, or the pattern when getting globally.
+        :type user_or_pattern: User | str | None
+        :param pattern: The pattern to apply to the key names in the data store.
+        :type pattern: str
+        :return: An iterator over the keys from the data store.
+        :rtype: Iterator[str]
         """
-        params = self.__user_or_key_checker(user_or_pattern, pattern, "pattern")
         if isinstance(user_or_pattern, User):
+            response = self._post_get_keys_user(user_or_pattern, pattern)
+        else:
+            response = self._post_get_keys_global(
+                pattern if user_or_pattern is None else user_or_pattern
+            )
+        return self._iter_keys_from(response)
+
+    def _post_get_keys_user(self, user: User, pattern: Optional[str]) -> Response:
+        if user.token is None:
+            raise ValueError("User must have a token set.")
+        params = {"username": user.username, "user_token": user.token}
+        if pattern is not None:
+            self._check_pattern_supported()
             params["pattern"] = pattern
-        if (
-            params.get("pattern") is not None
-            and VERSIONS[self.requester.api_version] < VERSIONS["v1_2"]
-        ):
+        return self.requester.post(self.requester.DATASTORE.GET_KEYS(**params))
+
+    def _post_get_keys_global(self, pattern: Optional[str]) -> Response:
+        params = {}
+        if pattern is not None:
+            self._check_pattern_supported()
+            params["pattern"] = pattern
+        return self.requester.post(self.requester.DATASTORE.GET_KEYS(**params))
+
+    @staticmethod
+    def _iter_keys_from(response: Response) -> Iterator[str]:
+        # the API answers with [{"key": ...}, ...], map + itemgetter unwraps them in C
+        return map(_extract_key, response.response.get("keys") or ())
+
+    def _check_pattern_supported(self):
+        if not self._min_v1_2_ok:
             raise ValueError(
                 "API version mismatch: pattern argument is only supported at API version v1_2"
             )
-
-        return self.requester.post(self.requester.DATASTORE.GET_KEYS(**params)).keys
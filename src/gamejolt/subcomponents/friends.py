@@ -2,7 +2,7 @@
 
 from ..models import User
 from .component import Component
-from .helpers import api_version_guard, token_required
+from .helpers import guarded
 
 
 class FriendsComponent(Component):
@@ -12,8 +12,9 @@ class FriendsComponent(Component):
     This component handles fetching friends from the Game Jolt API.
     """
 
-    @api_version_guard("v1_2")
-    @token_required
+    __slots__ = ()
+
+    @guarded("v1_2", token=True)
     def fetch(self, user: User) -> list[User]:
         """
         Fetches friends for the specified user.
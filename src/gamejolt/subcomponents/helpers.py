@@ -1,28 +1,177 @@
 """This module provides a helper functions"""
 
-from typing import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from time import monotonic
+from typing import Callable, Iterable
 from functools import wraps
 from ..constants import VERSIONS
 from ..models import User
 
 
-def instance_checker(type: type, iterable: Iterable):
+def classify_types(iterable: Iterable) -> tuple[bool, bool]:
     """
-    Checks if any element in the iterable is an instance of a given type.
+    Checks in a single pass whether the iterable contains integers and strings.
 
-    This function takes a type and an iterable, and checks if any element
-    in the iterable is an instance of the specified type. It returns True
-    if at least one element matches the type, otherwise False.
+    Only exact ints and strs are accepted, the types are compared by identity. The
+    loop stops as soon as both have been seen.
 
-    :param type: The type to check against.
-    :type type: type
     :param iterable: An iterable containing elements to check.
     :type iterable: Iterable
-    :return: True if any element is an instance of the specified type, otherwise False.
-    :rtype: bool
+    :return: Whether the iterable contains an int, and whether it contains a str.
+    :rtype: tuple[bool, bool]
+    :raises TypeError: If an element is neither an int nor a str.
     """
+    has_int = has_str = False
+    for obj in iterable:
+        t = type(obj)
+        if t is int:
+            has_int = True
+        elif t is str:
+            has_str = True
+        else:
+            raise TypeError(f"expected an int or a str, got {t.__name__}")
+        if has_int and has_str:
+            break
+    return has_int, has_str
+
+
+def map_concurrently(func: Callable, *iterables: Iterable, max_workers: int) -> list:
+    """
+    Calls a function over the items of the iterables on a thread pool.
+
+    Used by the bulk methods of the components: the Game Jolt API has no batch
+    endpoints for them, so their requests overlap their round trips instead.
+
+    The workers share the requester: use one with a pooled, thread-safe session
+    (like `SessionRequester`) so they reuse connections instead of each opening their own.
+
+    :param func: The function to call.
+    :type func: Callable
+    :param iterables: The iterables to take the arguments from.
+    :type iterables: Iterable
+    :param max_workers: The maximum number of requests in flight.
+    :type max_workers: int
+    :return: The results, in the order of the items.
+    :rtype: list
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(func, *iterables))
+
+
+class TTLCache:
+    """
+    A small mapping whose entries expire after a fixed time.
+
+    Once `maxsize` entries are stored, the oldest one is evicted to make room.
+
+    :param maxsize: The maximum number of entries.
+    :type maxsize: int
+    :param ttl: The time an entry stays valid, in seconds. A ttl of 0 disables the cache.
+    :type ttl: float
+    """
+
+    __slots__ = ("maxsize", "ttl", "_entries")
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: dict = {}
+
+    def get(self, key, default=None):
+        """
+        Returns the value of a key if it has not expired yet.
+
+        :param key: The key to look up.
+        :param default: The value returned on a miss. (default: None)
+        :return: The cached value, or default.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        expires, value = entry
+        if expires <= monotonic():
+            self._entries.pop(key, None)
+            return default
+        return value
+
+    def set(self, key, value) -> None:
+        """
+        Stores a value for the next `ttl` seconds.
+
+        :param key: The key to store the value under.
+        :param value: The value to store.
+        """
+        if self.ttl <= 0:
+            return
+        if len(self._entries) >= self.maxsize:
+            # pop with a default, another thread may have evicted it already
+            self._entries.pop(next(iter(self._entries), None), None)
+        self._entries[key] = (monotonic() + self.ttl, value)
+
+    def pop(self, key) -> None:
+        """
+        Removes a key, if it is stored.
+
+        :param key: The key to remove.
+        """
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Removes every entry."""
+        self._entries.clear()
+
+
+def guarded(api_version: str | None = None, token: bool = False):
+    """
+    Decorator for checking the API version and the user token in one wrapper.
+
+    The required version is resolved once at decoration time and compared against
+    the version number the component resolved at construction.
+
+    :param api_version: The API version the method is supported on. (optional)
+    :type api_version: str | None
+    :param token: Whether the first argument is a user that must have a token. (default: False)
+    :type token: bool
+
+    :raise ValueError: If the API version does not match the one the method is supported on,
+        or if the user token is not provided.
+    """
+    required = None if api_version is None else VERSIONS[api_version]
+
+    def wrapper(func):
+        message = f"API version mismatch: {func.__name__}() is only supported at API version {api_version}"
+
+        if required is not None and token:
 
-    return any(map(lambda obj: isinstance(obj, type), iterable))
+            @wraps(func)
+            def inner(self, user: User, *args, **kwargs):
+                if self._api_version_num < required:
+                    raise ValueError(message)
+                if user.token is None:
+                    raise ValueError("A user token is required.")
+                return func(self, user, *args, **kwargs)
+
+        elif required is not None:
+
+            @wraps(func)
+            def inner(self, *args, **kwargs):
+                if self._api_version_num < required:
+                    raise ValueError(message)
+                return func(self, *args, **kwargs)
+
+        elif token:
+
+            @wraps(func)
+            def inner(self, user: User, *args, **kwargs):
+                if user.token is None:
+                    raise ValueError("A user token is required.")
+                return func(self, user, *args, **kwargs)
+
+        else:
+            return func
+        return inner
+
+    return wrapper
 
 
 def api_version_guard(api_version: str):
@@ -37,19 +186,7 @@ def api_version_guard(api_version: str):
 
     :raise ValueError: If the API version does not match the one the method is supported on.
     """
-
-    def wrapper(func):
-        @wraps(func)
-        def inner(self, *args, **kwargs):
-            if VERSIONS[self.requester.api_version] < VERSIONS[api_version]:
-                raise ValueError(
-                    f"API version mismatch: {func.__name__}() is only supported at API version {api_version}"
-                )
-            return func(self, *args, **kwargs)
-
-        return inner
-
-    return wrapper
+    return guarded(api_version)
 
 
 def token_required(func):
@@ -58,11 +195,4 @@ def token_required(func):
     will raise a ValueError if the user token is not provided
     it expects the first argument to be a user
     """
-
-    @wraps(func)
-    def wrapper(self, user: User, *args, **kwargs):
-        if user.token is None:
-            raise ValueError("A user token is required.")
-        return func(self, user, *args, **kwargs)
-
-    return wrapper
+    return guarded(token=True)(func)
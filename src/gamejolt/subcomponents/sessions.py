@@ -1,9 +1,10 @@
 """This module provides the Sessions component for interacting with the Game Jolt API."""
 
+from typing import Iterable
 from ..models import User
 from ..errors import ApiError
 from .component import Component
-from .helpers import token_required, api_version_guard
+from .helpers import guarded, token_required, map_concurrently
 
 
 class SessionsComponent(Component):
@@ -13,6 +14,8 @@ class SessionsComponent(Component):
     This component handles opening, pinging, checking and closing sessions from the Game Jolt API.
     """
 
+    __slots__ = ()
+
     @token_required
     def open(self, user: User) -> bool:
         """
@@ -27,6 +30,21 @@ class SessionsComponent(Component):
             self.requester.SESSIONS.OPEN(username=user.username, user_token=user.token)
         ).success
 
+    def open_many(self, users: Iterable[User], max_workers: int = 8) -> list[bool]:
+        """
+        Opens the sessions of many users concurrently.
+
+        The requests run through `helpers.map_concurrently`, see it for the requester to use.
+
+        :param users: The users to open the sessions for.
+        :type users: Iterable[User]
+        :param max_workers: The maximum number of requests in flight. (default: 8)
+        :type max_workers: int
+        :return: booleans indicating whether each session was opened, in the order of the users.
+        :rtype: list[bool]
+        """
+        return map_concurrently(self.open, users, max_workers=max_workers)
+
     @token_required
     def ping(self, user: User) -> bool:
         """
@@ -41,8 +59,22 @@ class SessionsComponent(Component):
             self.requester.SESSIONS.PING(username=user.username, user_token=user.token)
         ).success
 
-    @api_version_guard("v1_2")
-    @token_required
+    def ping_many(self, users: Iterable[User], max_workers: int = 8) -> list[bool]:
+        """
+        Pings the sessions of many users concurrently.
+
+        The requests run through `helpers.map_concurrently`, see it for the requester to use.
+
+        :param users: The users to ping the sessions for.
+        :type users: Iterable[User]
+        :param max_workers: The maximum number of requests in flight. (default: 8)
+        :type max_workers: int
+        :return: booleans indicating whether each session was pinged, in the order of the users.
+        :rtype: list[bool]
+        """
+        return map_concurrently(self.ping, users, max_workers=max_workers)
+
+    @guarded("v1_2", token=True)
     def check(self, user: User) -> bool:
         """
         Checks if a session is open.
@@ -76,3 +108,18 @@ class SessionsComponent(Component):
         return self.requester.post(
             self.requester.SESSIONS.CLOSE(username=user.username, user_token=user.token)
         ).success
+
+    def close_many(self, users: Iterable[User], max_workers: int = 8) -> list[bool]:
+        """
+        Closes the sessions of many users concurrently.
+
+        The requests run through `helpers.map_concurrently`, see it for the requester to use.
+
+        :param users: The users to close the sessions for.
+        :type users: Iterable[User]
+        :param max_workers: The maximum number of requests in flight. (default: 8)
+        :type max_workers: int
+        :return: booleans indicating whether each session was closed, in the order of the users.
+        :rtype: list[bool]
+        """
+        return map_concurrently(self.close, users, max_workers=max_workers)
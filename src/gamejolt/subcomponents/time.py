@@ -1,23 +1,40 @@
 """This module provides the Time component for interacting with the Game Jolt API."""
 
 from ..models import Time
-from .component import Component
+from .component import CachedComponent
 from .helpers import api_version_guard
 
 
-class TimeComponent(Component):
+class TimeComponent(CachedComponent):
     """
     Time Component
 
     This component handles fetching the current time from the Game Jolt API.
+
+    Attributes
+    -----------
+        cache_ttl (float): How long a fetched time is reused, in seconds. Defaults to 0, which
+            disables the cache so every fetch returns the current server time. Polling loops can
+            set it on the instance, e.g. `gamejolt.time.cache_ttl = 1`.
     """
 
+    __slots__ = ()
+
+    cache_size = 1
+
     @api_version_guard("v1_2")
     def fetch(self) -> Time:
         """
         Fetches the current time from the Game Jolt API.
 
+        When `cache_ttl` is set, the response is reused for that many seconds, so
+        polling loops do not send a request per call.
+
         :return: A Time instance containing the time.
         :rtype: Time
         """
-        return Time.from_dict(self.requester.post(self.requester.TIME.FETCH()).response)
+        response = self._cache.get(None)
+        if response is None:
+            response = self.requester.post(self.requester.TIME.FETCH()).response
+            self._cache.set(None, response)
+        return Time.from_dict(response)
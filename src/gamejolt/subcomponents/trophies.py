@@ -1,6 +1,6 @@
 """This module provides the Trophies component for interacting with the Game Jolt API."""
 
-from typing import overload, NoReturn
+from typing import Iterable, overload, NoReturn
 from ..errors import (
     IncorrectTrophyID,
     UserAlreadyHasTrophy,
@@ -9,20 +9,31 @@ from ..errors import (
 )
 
 from ..models import User, Trophy
-from .component import Component
-from .helpers import api_version_guard, token_required
-
+from .component import CachedComponent
+from .helpers import guarded, token_required
 
 # TODO: add overload for add_achieved, remove_achieved so it can take id as int, or it could take a trophy object
 # FIXME: fix fetch overload, it could take more than one id
 
 
-class TrophiesComponent(Component):
+class TrophiesComponent(CachedComponent):
     """Trophies Component
 
     This component handles fetching trophies from the Game Jolt API.
+
+    Attributes
+    -----------
+        cache_ttl (float): How long a trophy fetched by id is reused, in seconds. Defaults to 0,
+            which disables the cache: the achieved state can change outside the process (on the
+            site or from another client), so only enable it, e.g. `gamejolt.trophies.cache_ttl = 60`,
+            when that staleness is acceptable.
+        cache_size (int): The maximum number of trophies kept.
     """
 
+    __slots__ = ()
+
+    cache_size = 256
+
     @overload
     def fetch(self, user: User, *, achieved: bool = None) -> list[Trophy]:
         """Fetches all trophies for the specified user.
@@ -63,23 +74,72 @@ class TrophiesComponent(Component):
         :return: A list of Trophy instances if no trophy_id is given, or a single Trophy if a trophy_id is given.
         :rtype: list[Trophy] | Trophy
         :raises ValueError: If the User does not have a token set.
+
+        When `cache_ttl` is set, a single trophy fetched by id without an achieved filter
+        is reused for that many seconds, `add_achieved` and `remove_achieved` drop it.
         """
-        url_kwargs = {
-            "username": user.username,
-            "user_token": user.token,
-            "trophies": ",".join(map(str, [trophy_id, *ids])) or None,
-            "achieved": kw.get("achieved"),
-        }
-        url_kwargs = {
-            k: v for k, v in url_kwargs.items() if v is not None
-        }  # filter None values
-
-        url = self.requester.TROPHIES.FETCH(**url_kwargs)
-        response = self.requester.post(url)
-
-        if trophy_id is not None and not ids:  # we know that it's a single trophy
-            return Trophy.from_dict(response.response["trophies"][0])
-        return Trophy.from_list(response.response["trophies"])
+        achieved = kw.get("achieved")
+        single = trophy_id is not None and not ids
+        if single and achieved is None:
+            data = self._cache.get((user.username, trophy_id))
+            if data is not None:
+                return Trophy.from_dict(data)
+
+        url_kwargs = {"username": user.username, "user_token": user.token}
+        if trophy_id is not None:
+            url_kwargs["trophy_id"] = ",".join(map(str, (trophy_id, *ids)))
+        if achieved is not None:
+            url_kwargs["achieved"] = achieved
+        trophies = self.requester.post(
+            self.requester.TROPHIES.FETCH(**url_kwargs)
+        ).response["trophies"]
+
+        if single:  # we know that it's a single trophy
+            if achieved is None:
+                self._cache.set((user.username, trophy_id), trophies[0])
+            return Trophy.from_dict(trophies[0])
+        return Trophy.from_list(trophies)
+
+    @token_required
+    def fetch_many(
+        self,
+        user: User,
+        trophy_ids: Iterable[int],
+        chunk_size: int = 50,
+        *,
+        achieved: bool = None,
+    ) -> list[Trophy]:
+        """
+        Fetches many trophies for the specified user, batching them into as few requests as possible.
+
+        Prefer this over calling `fetch` in a loop, every request carries up to
+        `chunk_size` ids.
+
+        :param user: The user to fetch trophies for.
+        :type user: User
+        :param trophy_ids: The IDs of the trophies to fetch.
+        :type trophy_ids: Iterable[int]
+        :param chunk_size: The maximum number of ids sent per request. (default: 50)
+        :type chunk_size: int
+        :param achieved: Whether to filter trophies by achieved status. (default: None)
+        :type achieved: bool
+        :return: A list of Trophy instances.
+        :rtype: list[Trophy]
+        :raises ValueError: If the User does not have a token set.
+        """
+        trophy_ids = list(trophy_ids)
+        trophies = []
+        for start in range(0, len(trophy_ids), chunk_size):
+            url_kwargs = {
+                "username": user.username,
+                "user_token": user.token,
+                "trophy_id": ",".join(map(str, trophy_ids[start : start + chunk_size])),
+            }
+            if achieved is not None:
+                url_kwargs["achieved"] = achieved
+            response = self.requester.post(self.requester.TROPHIES.FETCH(**url_kwargs))
+            trophies.extend(Trophy.from_list(response.response["trophies"]))
+        return trophies
 
     @token_required
     def add_achieved(self, user: User, trophy_id: int):
@@ -96,13 +156,13 @@ class TrophiesComponent(Component):
         url = self.requester.TROPHIES.ADD_ACHIEVED(
             username=user.username, user_token=user.token, trophy_id=trophy_id
         )
+        self._cache.pop((user.username, trophy_id))
         try:
             return self.requester.post(url)
         except ApiError as e:
             self._raise_error(e, trophy_id, user)
 
-    @api_version_guard("v1_2")
-    @token_required
+    @guarded("v1_2", token=True)
     def remove_achieved(self, user: User, trophy_id: int):
         """
         Removes the specified trophy from the user's achieved trophies.
@@ -117,6 +177,7 @@ class TrophiesComponent(Component):
         url = self.requester.TROPHIES.REMOVE_ACHIEVED(
             username=user.username, user_token=user.token, trophy_id=trophy_id
         )
+        self._cache.pop((user.username, trophy_id))
         try:
             return self.requester.post(url)
         except ApiError as e:
@@ -1,19 +1,40 @@
 """This module provides the Users component for interacting with the Game Jolt API."""
 
-from typing import overload
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, overload
+from urllib.parse import quote_plus
 
-from .helpers import instance_checker
+from .helpers import classify_types, map_concurrently
+from .. import RequesterAbstract
+from ..endpoints import Endpoints
 from ..models import User, Response
-from .component import Component
+from .component import CachedComponent
 
 
-class UsersComponent(Component):
+class UsersComponent(CachedComponent):
     """
     Users Component
 
     This component handles fetching users from the Game Jolt API.
+
+    Attributes
+    -----------
+        cache_ttl (float): How long fetched users are reused, in seconds. Defaults to 0, which
+            disables the cache so every fetch sees the current profile. Set it on the instance
+            to enable it, e.g. `gamejolt.users.cache_ttl = 300`.
+        cache_size (int): The maximum number of users kept, by id and by username.
     """
 
+    __slots__ = ("_ids_url", "_username_url")
+
+    cache_size = 1024
+
+    def __init__(self, requester: RequesterAbstract, cache_ttl: float = 0.0) -> None:
+        super().__init__(requester, cache_ttl)
+        # the unsigned fetch URLs up to the ids/username, only the value is encoded per call
+        self._ids_url = requester.format_prefix(Endpoints.USERS.FETCH, "user_id")
+        self._username_url = requester.format_prefix(Endpoints.USERS.FETCH, "username")
+
     @overload
     def fetch(self, id: int) -> User:
         """
@@ -56,18 +77,142 @@ class UsersComponent(Component):
         :return: A list of User instances if multiple users where passed, otherwise a single User instance.
         :rtype: list[User] | User
 
-        :raises TypeError: If the iterable contains a mix of integers and strings.
+        :raises TypeError: If the iterable contains a mix of integers and strings, or any other type.
+
+        Duplicates are requested once. When `cache_ttl` is set, every fetched user is
+        reused for that many seconds, by id and by username, so only the users missing
+        from the cache are requested. Fresh instances are built every time so changing
+        one does not affect the cache, use `invalidate_user` to drop a user early.
+        """
+        if len(users) == 1:  # the common case, no batching needed
+            (key,) = users
+            data = self._cache.get(key)
+            if data is None:
+                has_int, _ = classify_types(users)
+                data = self._request_users(users, has_int)[key]
+            return User.from_dict(data)
+        return self.fetch_iter(users)
+
+    def fetch_iter(self, users: Iterable[int | str]) -> list[User]:
+        """
+        Fetches users from an iterable of ids or usernames.
+
+        The iterable is consumed once, straight into the deduplicated keys, without
+        unpacking it into arguments first. Caching works as in `fetch`.
+
+        :param users: The ids or usernames of the users to be fetched.
+        :type users: Iterable[int | str]
+        :return: A list of User instances, in the order of the users.
+        :rtype: list[User]
+
+        :raises TypeError: If the iterable contains a mix of integers and strings, or any other type.
         """
-        if instance_checker(int, users) and instance_checker(str, users):
+        keys = tuple(dict.fromkeys(users))  # drop duplicates, keep the order
+        has_int, has_str = classify_types(keys)
+        if has_int and has_str:
             raise TypeError("the iterable should be an array of intagers only")
 
-        if instance_checker(int, users):
-            url = self.requester.USERS.FETCH(user_id=",".join(map(str, users)))
+        found = {}
+        missing = []
+        for key in keys:
+            data = self._cache.get(key)
+            if data is None:
+                missing.append(key)
+            else:
+                found[key] = data
+        if missing:
+            found.update(self._request_users(missing, has_int))
+        return User.from_list([found[key] for key in keys if key in found])
+
+    def _request_users(self, keys, by_id: bool) -> dict:
+        """
+        Requests users and stores them in the cache, by id and by username.
+
+        Ids are requested in a single call, the API only takes one username per call
+        so usernames are requested one by one.
+
+        :param keys: The ids or usernames of the users.
+        :param by_id: Whether the keys are ids.
+        :type by_id: bool
+        :return: The users data, by id and by username.
+        :rtype: dict
+        """
+        post, sign = self.requester.post, self.requester.format_signature
+        found = {}
+        if by_id:
+            # ids are digits, only the separating commas need encoding
+            url = sign(self._ids_url + "%2C".join(map(str, keys)))
+            fetched = post(url).response["users"]
+        else:
+            fetched = []
+            for username in keys:
+                url = sign(self._username_url + quote_plus(username))
+                data = post(url).response["users"][0]
+                # the API may answer with a differently cased username
+                found[username] = data
+                self._cache.set(username, data)
+                fetched.append(data)
+        for data in fetched:
+            found[int(data["id"])] = found[data["username"]] = data
+            self._cache.set(int(data["id"]), data)
+            self._cache.set(data["username"], data)
+        return found
+
+    def invalidate_user(self, user: int | str | User) -> None:
+        """
+        Drops a user from the cache of `fetch`, so the next fetch requests it again.
+
+        :param user: The id, username or instance of the user.
+        :type user: int | str | User
+        """
+        if isinstance(user, User):
+            keys = (user.id, user.username)
         else:
-            url = self.requester.USERS.FETCH(username="".join(users))
-        rp = self.requester.post(url)
-        if len(users) == 1:
-            return User.from_dict(rp.response["users"][0])
+            data = self._cache.get(user)
+            keys = (
+                (user,) if data is None else (user, int(data["id"]), data["username"])
+            )
+        for key in keys:
+            self._cache.pop(key)
+
+    def fetch_many(
+        self, ids: Iterable[int], chunk_size: int = 50, max_workers: int = 1
+    ) -> list[User]:
+        """
+        Fetches many users by id, batching them into as few requests as possible.
+
+        Prefer this over calling `fetch` in a loop, every request carries up to
+        `chunk_size` ids. With `max_workers` above 1 the requests of the chunks run
+        concurrently through `helpers.map_concurrently`, see it for the requester to use.
+
+        :param ids: The ids of the users to be fetched.
+        :type ids: Iterable[int]
+        :param chunk_size: The maximum number of ids sent per request. (default: 50)
+        :type chunk_size: int
+        :param max_workers: The maximum number of requests in flight. (default: 1)
+        :type max_workers: int
+        :return: A list of User instances.
+        :rtype: list[User]
+        """
+        ids = list(ids)
+        chunks = [
+            ids[start : start + chunk_size] for start in range(0, len(ids), chunk_size)
+        ]
+        if max_workers > 1 and len(chunks) > 1:
+            batches = map_concurrently(
+                self._fetch_chunk, chunks, max_workers=max_workers
+            )
+        else:
+            batches = map(self._fetch_chunk, chunks)
+        users = []
+        for batch in batches:
+            users.extend(batch)
+        return users
+
+    def _fetch_chunk(self, ids: list[int]) -> list[User]:
+        rp = self.requester.post(
+            self.requester.USERS.FETCH(user_id=",".join(map(str, ids)))
+        )
         return User.from_list(rp.response["users"])
 
     def authenticate(self, username: str, token: str) -> Response:
@@ -78,7 +223,36 @@ class UsersComponent(Component):
         :type username: str
         :param token: The token of the user to be authenticated.
         :type token: str
+        :return: The response of the request, the API answers with the success only.
+        :rtype: Response
+        :raises ApiError: If the username or token is invalid.
+
+        Use `authenticate_and_fetch` to get the authenticated User as well.
         """
         return self.requester.post(
             self.requester.USERS.AUTH(username=username, user_token=token)
         )
+
+    def authenticate_and_fetch(
+        self, username: str, token: str
+    ) -> tuple[Response, User]:
+        """
+        Authenticates a user and fetches it, overlapping both requests.
+
+        The Game Jolt API has no combined endpoint, so the authentication runs on a
+        worker thread while the user is fetched, the login costs a single round trip.
+
+        :param username: The username of the user to be authenticated.
+        :type username: str
+        :param token: The token of the user to be authenticated.
+        :type token: str
+        :return: The authentication response and the user, with its token set.
+        :rtype: tuple[Response, User]
+        :raises ApiError: If the authentication or the fetch failed.
+        """
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            auth = executor.submit(self.authenticate, username, token)
+            user = self.fetch(username)
+            response = auth.result()
+        user.set_token(token)
+        return response, user
@@ -1,4 +1,12 @@
 class AttrDict(dict):
+    """
+    A dict whose items can also be accessed as attributes.
+
+    A convenience for users (the endpoint wrappers are AttrDicts). Attribute access
+    goes through a Python level `__getattr__`, so API responses are kept as plain
+    dicts and the library indexes them by subscript.
+    """
+
     __slots__ = ()
     def __getattr__(self, attr):
         try: